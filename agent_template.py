@@ -15,10 +15,41 @@ or in a sidecar file at ~/Documents/AgentBridgeConfig/settings.json:
     { "slack_bot_token": "xoxb-...", "slack_channel": "C0XXXXXXX" }
 """
 
+import gzip
 import json
 import http.client
+import selectors
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from pathlib import Path
 from typing import Any
+from urllib.parse import quote
+
+# orjson's C decoder takes bytes natively and is several times faster than
+# stdlib json on the large /log, /diagnostics and /read-file payloads.
+# Entirely optional — everything falls back to stdlib json without it.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps                      # returns bytes directly
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+_EMPTY = b"{}"   # shared body for parameterless POSTs — no per-call dumps/encode
+
+# Built once and reused — skips the f-string formatter and a fresh header
+# dict on every call in the polling loops (the dict is only read, never
+# mutated, by the request machinery).
+_HDR_JSON     = {"Content-Type": "application/json"}
+_PATH_WATCH   = "/watch-result?id="
+_PATH_CHANGES = "/changes-since?ts="
+_PATH_STATUS  = "/copilot-task/status?id="
 
 
 # ── Configuration ──────────────────────────────────────────────────────────────
@@ -27,6 +58,136 @@ BRIDGE_PORTS   = [3131, 3132, 3133, 3134]
 BRIDGE_HOST    = "127.0.0.1"
 DEFAULT_TIMEOUT = 300          # seconds for LLM calls
 POLL_INTERVAL   = 2.0          # seconds between status polls
+PORT_CACHE      = Path.home() / ".cache" / "agent_bridge" / "port"
+
+
+# ── Request validation ────────────────────────────────────────────────────────
+
+# Known-bad payloads (empty prompt, missing command) fail locally instead of
+# costing a round-trip to the server's 400. With fastjsonschema installed the
+# compiled validator also type-checks fields; the fallback just enforces
+# required keys being present and non-empty.
+try:
+    import fastjsonschema
+
+    def _compile_validator(schema: dict):
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(body: dict) -> None:
+            try:
+                compiled(body)
+            except fastjsonschema.JsonSchemaException as e:
+                raise BridgeError(f"invalid request body: {e}") from None
+        return validate
+except ImportError:
+    def _compile_validator(schema: dict):
+        required = schema.get("required", [])
+
+        def validate(body: dict) -> None:
+            for key in required:
+                if not body.get(key) and body.get(key) not in (0, False):
+                    raise BridgeError(f"invalid request body: {key!r} is required")
+        return validate
+
+
+_VALIDATE_PROMPT = _compile_validator({
+    "type": "object",
+    "required": ["prompt", "timeout"],
+    "properties": {
+        "prompt":        {"type": "string", "minLength": 1},
+        "timeout":       {"type": "number"},
+        "model":         {"type": "string"},
+        "system":        {"type": "string"},
+        "context_files": {"type": "array", "items": {"type": "string"}},
+        "context_globs": {"type": "array", "items": {"type": "string"}},
+    },
+})
+
+_VALIDATE_RUN_TERMINAL = _compile_validator({
+    "type": "object",
+    "required": ["command"],
+    "properties": {
+        "command":        {"type": "string", "minLength": 1},
+        "capture_output": {"type": "boolean"},
+        "cwd":            {"type": "string"},
+        "timeout":        {"type": "number"},
+    },
+})
+
+
+# ── Connection ────────────────────────────────────────────────────────────────
+
+class _BridgeConnection(http.client.HTTPConnection):
+    """
+    HTTPConnection with Nagle's algorithm disabled and TCP keep-alive on.
+
+    With Nagle active, a small POST whose headers and body land in separate
+    packets can stall up to ~40 ms on loopback waiting for a delayed ACK —
+    directly visible in the auto-dismiss and watch polling cadence.
+    """
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+# ── Fast raw-socket GET path ───────────────────────────────────────────────────
+
+# GETs the auto-dismiss/watch polling loops issue every second or two. These
+# skip http.client's Python-level header parsing via _FastClient below.
+HOT_GET_PATHS = ("/auto-dismiss", "/pending-approvals", "/watch-result")
+
+
+class _FastClient:
+    """
+    Minimal keep-alive GET client for the tight polling endpoints.
+
+    http.client parses the status line and every header in Python, which
+    dominates sub-millisecond loopback RPCs. This sends one precomputed
+    request blob per call and scans the reply with bytes.find/recv_into
+    into a reusable buffer. Only plain Content-Length responses are
+    handled — callers fall back to the general path on any error.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.sock: socket.socket | None = None
+        self._recv_buf = bytearray(65536)
+        self._suffix = f" HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode()
+
+    def close(self) -> None:
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def _recv(self, buf: bytearray) -> None:
+        n = self.sock.recv_into(self._recv_buf)
+        if not n:
+            raise ConnectionError("bridge closed the fast-path socket")
+        buf += self._recv_buf[:n]
+
+    def get(self, path: str) -> tuple[int, dict]:
+        if self.sock is None:
+            self.sock = socket.create_connection((self.host, self.port), timeout=10)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.sendall(b"GET " + path.encode() + self._suffix)
+        buf = bytearray()
+        while (end := buf.find(b"\r\n\r\n")) < 0:
+            self._recv(buf)
+        head, body = bytes(buf[:end]).lower(), buf[end + 4:]
+        status = int(head[9:12])
+        i = head.find(b"content-length:")
+        if i < 0:
+            raise ValueError("no Content-Length in fast-path response")
+        length = int(head[i + 15:head.find(b"\r\n", i) if head.find(b"\r\n", i) > 0 else len(head)])
+        while len(body) < length:
+            self._recv(body)
+        return status, _loads(bytes(body[:length]))
 
 
 # ── Core client ────────────────────────────────────────────────────────────────
@@ -39,58 +200,205 @@ class AgentBridge:
 
     def __init__(self, host: str = BRIDGE_HOST, port: int | None = None):
         self.host = host
-        self.port = port or self._discover_port()
+        self.port = port               # discovered lazily on the first RPC
+        self._conn_cache: http.client.HTTPConnection | None = None
+        self._conn_lock = threading.Lock()
+        self._fast: _FastClient | None = None
+        self._fast_lock = threading.Lock()
+        self._fast_disabled = False
+        self._info_cache: dict[str, tuple[float, dict]] = {}
 
     # ── Internal helpers ──────────────────────────────────────────────────
 
+    def _port_open(self, port: int) -> bool:
+        s = socket.socket()
+        s.settimeout(0.25)
+        try:
+            return s.connect_ex((self.host, port)) == 0
+        finally:
+            s.close()
+
     def _discover_port(self) -> int:
-        for p in BRIDGE_PORTS:
+        # Pre-screen with a cheap TCP connect so dead ports fail in <1 ms
+        # instead of a 10-s probe timeout, then hit the survivors' /health
+        # concurrently — first ok wins. Serial probing cost up to 30 s when
+        # the bridge sat on the last port.
+        candidates = [p for p in BRIDGE_PORTS if self._port_open(p)]
+        if candidates:
+            ex = ThreadPoolExecutor(max_workers=len(candidates))
+            try:
+                futures = {ex.submit(self._raw_get, p, "/health"): p for p in candidates}
+                for f in as_completed(futures, timeout=5):
+                    try:
+                        if f.result().get("ok"):
+                            return futures[f]
+                    except Exception:
+                        pass
+            # futures.TimeoutError only aliases the builtin from 3.11 on —
+            # catch both so 3.10 still reports the BridgeError below.
+            except (TimeoutError, FuturesTimeoutError):
+                pass
+            finally:
+                ex.shutdown(wait=False, cancel_futures=True)
+        raise BridgeError(f"No bridge found on ports {BRIDGE_PORTS}. Is VS Code running with the extension?")
+
+    def _cached_or_discover(self) -> int:
+        # Short-lived scripts shouldn't pay discovery on every run: the last
+        # known good port is cached on disk and revalidated with one cheap
+        # probe before falling back to full discovery.
+        try:
+            p = int(PORT_CACHE.read_text())
+        except (OSError, ValueError):
+            p = 0
+        if p in BRIDGE_PORTS and self._port_open(p):
             try:
-                data = self._raw_get(p, "/health")
-                if data.get("ok"):
+                if self._raw_get(p, "/health").get("ok"):
                     return p
             except Exception:
                 pass
-        raise BridgeError(f"No bridge found on ports {BRIDGE_PORTS}. Is VS Code running with the extension?")
+        p = self._discover_port()
+        try:
+            PORT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            PORT_CACHE.write_text(str(p))
+        except OSError:
+            pass
+        return p
 
     def _conn(self) -> http.client.HTTPConnection:
-        return http.client.HTTPConnection(self.host, self.port, timeout=DEFAULT_TIMEOUT + 10)
+        if self.port is None:
+            self.port = self._cached_or_discover()
+        if self._conn_cache is None:
+            self._conn_cache = _BridgeConnection(self.host, self.port, timeout=DEFAULT_TIMEOUT + 10)
+        return self._conn_cache
+
+    def _drop_conn(self) -> None:
+        if self._conn_cache is not None:
+            try:
+                self._conn_cache.close()
+            except Exception:
+                pass
+            self._conn_cache = None
 
     def _raw_get(self, port: int, path: str) -> dict:
-        c = http.client.HTTPConnection(self.host, port, timeout=10)
+        c = _BridgeConnection(self.host, port, timeout=10)
         c.request("GET", path)
-        return json.loads(c.getresponse().read())
+        return _loads(c.getresponse().read())
+
+    def _request(self, method: str, path: str, payload: bytes | None = None,
+                 headers: dict[str, str] | None = None, timeout: float | None = None) -> tuple[int, dict]:
+        """
+        Issue one request over the persistent keep-alive connection.
+
+        The socket is reused across calls (saves a TCP handshake per RPC);
+        if the server closed it between calls, reconnect and retry once.
+        A lock serializes concurrent callers on the single socket.
+        """
+        hdrs = {"Connection": "keep-alive", "Accept-Encoding": "gzip"}
+        if headers:
+            hdrs.update(headers)
+        t = timeout if timeout is not None else DEFAULT_TIMEOUT + 10
+        with self._conn_lock:
+            for attempt in (0, 1):
+                c = self._conn()
+                c.timeout = t
+                if c.sock is not None:
+                    c.sock.settimeout(t)   # per-call timeout must not stick to the shared socket
+                try:
+                    c.request(method, path, body=payload, headers=hdrs)
+                except Exception:
+                    # Send failed — nothing was processed, safe to retry once.
+                    self._drop_conn()
+                    if attempt:
+                        raise
+                    continue
+                try:
+                    resp = c.getresponse()
+                except http.client.BadStatusLine:
+                    # Stale keep-alive socket: the server hung up between
+                    # calls without starting a response (RemoteDisconnected
+                    # is a BadStatusLine). Reconnect and retry once.
+                    self._drop_conn()
+                    if attempt:
+                        raise
+                    continue
+                except Exception:
+                    self._drop_conn()
+                    raise
+                try:
+                    raw = resp.read()   # drain fully so the socket is reusable
+                    if resp.getheader("Content-Encoding") == "gzip":
+                        raw = gzip.decompress(raw)
+                    return resp.status, _loads(raw)
+                except Exception:
+                    # The response already began, so the server may well have
+                    # executed the request — re-sending here could run a POST
+                    # twice. Drop the poisoned connection and propagate.
+                    self._drop_conn()
+                    raise
+        raise BridgeError(f"{method} {path}: connection retry exhausted")  # unreachable
+
+    def _fast_get(self, path: str) -> tuple[int, dict]:
+        with self._fast_lock:
+            if self.port is None:
+                self.port = self._cached_or_discover()
+            if self._fast is None:
+                self._fast = _FastClient(self.host, self.port)
+            try:
+                return self._fast.get(path)
+            except Exception as e:
+                self._fast.close()
+                self._fast = None
+                if isinstance(e, ValueError):
+                    # The server doesn't speak the fast path's wire format
+                    # (e.g. chunked responses from an older extension) —
+                    # stop re-attempting it on every poll tick.
+                    self._fast_disabled = True
+                raise
 
     def _get(self, path: str) -> dict:
-        c = self._conn()
-        c.request("GET", path)
-        resp = c.getresponse()
-        data = json.loads(resp.read())
-        c.close()
-        if not data.get("ok") and resp.status >= 400:
+        if not self._fast_disabled and path.startswith(HOT_GET_PATHS):
+            try:
+                status, data = self._fast_get(path)
+            except Exception:
+                status, data = self._request("GET", path)
+        else:
+            status, data = self._request("GET", path)
+        if not data.get("ok") and status >= 400:
             raise BridgeError(f"GET {path} failed: {data.get('error', data)}")
         return data
 
     def _post(self, path: str, body: dict, timeout: int = DEFAULT_TIMEOUT) -> dict:
-        payload = json.dumps(body).encode()
-        c = http.client.HTTPConnection(self.host, self.port, timeout=timeout + 10)
-        c.request("POST", path, body=payload, headers={"Content-Type": "application/json"})
-        resp = c.getresponse()
-        data = json.loads(resp.read())
-        c.close()
-        if not data.get("ok") and resp.status >= 400:
+        return self._post_raw(path, _dumps(body), timeout)
+
+    def _post_raw(self, path: str, payload: bytes, timeout: int = DEFAULT_TIMEOUT) -> dict:
+        status, data = self._request("POST", path, payload,
+                                     headers=_HDR_JSON, timeout=timeout + 10)
+        if not data.get("ok") and status >= 400:
             raise BridgeError(f"POST {path} failed: {data.get('error', data)}")
         return data
 
     # ── Health / info ─────────────────────────────────────────────────────
 
+    def _cached_get(self, path: str, ttl: float = 1.0) -> dict:
+        # Sanity-check endpoints get hammered once per wrapped command;
+        # their answers don't change between back-to-back calls.
+        now = time.monotonic()
+        hit = self._info_cache.get(path)
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+        data = self._get(path)
+        self._info_cache[path] = (now, data)
+        return data
+
     def health(self) -> dict:
-        """Returns bridge status, version, available models, workspace path."""
-        return self._get("/health")
+        """Returns bridge status, version, available models, workspace path.
+        Cached for 1 s, so per-command sanity checks cost no extra round-trips."""
+        return self._cached_get("/health")
 
     def workspace_info(self) -> dict:
-        """Returns open workspace folders and the active file path."""
-        return self._get("/workspace-info")
+        """Returns open workspace folders and the active file path.
+        Cached for 1 s like health()."""
+        return self._cached_get("/workspace-info")
 
     def log(self) -> list[str]:
         """Returns the last 100 bridge request log entries."""
@@ -105,6 +413,7 @@ class AgentBridge:
         system: str = "",
         timeout: int = DEFAULT_TIMEOUT,
         context_files: list[str] | None = None,
+        context_globs: list[str] | None = None,
     ) -> str:
         """
         Send a prompt to Copilot and return the plain-text response.
@@ -115,15 +424,23 @@ class AgentBridge:
             system:        System prompt override.
             timeout:       Seconds to wait for the LLM response.
             context_files: Absolute paths to files whose contents will be injected.
+            context_globs: Workspace globs (e.g. 'src/**/*.ts') expanded server-side,
+                           so the request stays tiny no matter how many files match.
 
         Returns:
             The LLM's text response as a string.
         """
-        body: dict[str, Any] = {"prompt": prompt, "timeout": timeout}
-        if model:         body["model"] = model
-        if system:        body["system"] = system
-        if context_files: body["context_files"] = context_files
-        result = self._post("/prompt", body, timeout=timeout + 10)
+        _VALIDATE_PROMPT({"prompt": prompt, "timeout": timeout})
+        # The /prompt schema is fixed, so the body is concatenated from
+        # individually encoded fragments — no dict build or dumps walk on
+        # the hottest POST. Values still go through _dumps for escaping.
+        parts = [b'{"prompt":', _dumps(prompt), b',"timeout":', str(timeout).encode()]
+        if model:         parts += [b',"model":', _dumps(model)]
+        if system:        parts += [b',"system":', _dumps(system)]
+        if context_files: parts += [b',"context_files":', _dumps(context_files)]
+        if context_globs: parts += [b',"context_globs":', _dumps(context_globs)]
+        parts.append(b"}")
+        result = self._post_raw("/prompt", b"".join(parts), timeout=timeout + 10)
         return result.get("text", "")
 
     def copilot_task(
@@ -133,6 +450,7 @@ class AgentBridge:
         watch_secs: int = 60,
         timeout: int = DEFAULT_TIMEOUT,
         context_files: list[str] | None = None,
+        context_globs: list[str] | None = None,
         model: str = "",
     ) -> dict:
         """
@@ -142,6 +460,12 @@ class AgentBridge:
         3. Auto-accepts edits and saves all files
         4. Returns diff summary
 
+        Submits the task and polls its status with exponential backoff
+        (100 ms doubling-ish up to 2 s) instead of holding one socket for
+        the whole run, so a stalled server can't wedge the client and one
+        client can drive several tasks at once. Falls back to the blocking
+        /copilot-task call on older extensions without the job API.
+
         Returns dict with keys: llm_response, files_changed, diff_summary, elapsed_ms
         """
         body: dict[str, Any] = {
@@ -151,14 +475,88 @@ class AgentBridge:
             "timeout":      timeout,
         }
         if context_files: body["context_files"] = context_files
+        if context_globs: body["context_globs"] = context_globs
         if model:         body["model"] = model
-        return self._post("/copilot-task", body, timeout=timeout + watch_secs + 30)
+        _VALIDATE_PROMPT(body)
+        try:
+            job = self._post("/copilot-task/submit", body).get("job_id", "")
+        except BridgeError:
+            return self._post("/copilot-task", body, timeout=timeout + watch_secs + 30)
+        deadline = time.monotonic() + timeout + watch_secs + 30
+        delay = 0.1
+        while True:
+            r = self._get(_PATH_STATUS + job)
+            if r.get("done"):
+                # Failed jobs come back HTTP 200 { ok: false, error } — raise
+                # the same BridgeError the blocking fallback produces for the
+                # identical failure, so callers see one error contract.
+                if not r.get("ok", True):
+                    raise BridgeError(f"POST /copilot-task failed: {r.get('error', r)}")
+                return r
+            if time.monotonic() > deadline:
+                raise BridgeError(f"copilot_task job {job} did not finish in time")
+            time.sleep(delay)
+            delay = min(delay * 1.6, 2.0)
 
     # ── Filesystem ───────────────────────────────────────────────────────
 
     def read_file(self, path: str) -> str:
         """Read a file from disk and return its contents as a string."""
-        return self._get(f"/read-file?path={path}").get("content", "")
+        if len(path) > 1800:   # stay clear of URL length limits — send long paths as a body
+            return self._post("/read-file", {"path": path}).get("content", "")
+        return self._get(f"/read-file?path={quote(path, safe='')}").get("content", "")
+
+    def read_file_raw(self, path: str) -> str:
+        """
+        Read a large file with minimal peak memory.
+
+        With ijson installed, the "content" value is pulled straight off the
+        HTTP stream while the socket is still receiving, so the full JSON body
+        is never held in memory alongside the decoded string. Without ijson,
+        the body is accumulated chunk-by-chunk into a single reusable buffer
+        and parsed once. Prefer this over read_file for multi-MB files.
+        """
+        with self._conn_lock:
+            for attempt in (0, 1):
+                c = self._conn()
+                try:
+                    c.request("GET", f"/read-file?path={quote(path, safe='')}",
+                              headers={"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+                    resp = c.getresponse()
+                    break
+                except (http.client.BadStatusLine, ConnectionError):
+                    self._drop_conn()
+                    if attempt:
+                        raise
+                except Exception:
+                    self._drop_conn()
+                    raise
+            try:
+                stream = resp
+                if resp.getheader("Content-Encoding") == "gzip":
+                    stream = gzip.GzipFile(fileobj=resp)   # decompress incrementally off the socket
+                if resp.status >= 400:
+                    data = _loads(stream.read())
+                    raise BridgeError(f"GET /read-file failed: {data.get('error', data)}")
+                try:
+                    import ijson
+                except ImportError:
+                    buf = bytearray()
+                    while chunk := stream.read(65536):
+                        buf += chunk
+                    return _loads(buf).get("content", "")
+                content = ""
+                for value in ijson.items(stream, "content"):   # drains the stream fully
+                    content = value
+                return content
+            except BridgeError:
+                raise   # response was fully drained — the socket is still good
+            except Exception:
+                # A timeout or short read mid-stream leaves an unconsumed
+                # response behind; drop the connection rather than poison
+                # every later call with CannotSendRequest.
+                self._drop_conn()
+                raise
 
     def write_file(self, path: str, content: str, create_dirs: bool = True) -> int:
         """Write content to a file. Returns bytes written."""
@@ -170,7 +568,7 @@ class AgentBridge:
 
     def list_dir(self, path: str = "") -> list[str]:
         """List files/folders at path (defaults to workspace root)."""
-        return self._get(f"/list-dir?path={path}").get("entries", [])
+        return self._get(f"/list-dir?path={quote(path, safe='')}").get("entries", [])
 
     # ── Terminal ─────────────────────────────────────────────────────────
 
@@ -184,6 +582,7 @@ class AgentBridge:
         body: dict[str, Any] = {"command": command, "capture_output": capture_output}
         if cwd: body["cwd"] = cwd
         if capture_output: body["timeout"] = timeout
+        _VALIDATE_RUN_TERMINAL(body)
         return self._post("/run-terminal", body, timeout=timeout + 15)
 
     def run_and_capture(self, command: str, cwd: str = "", timeout: int = 120) -> str:
@@ -201,7 +600,7 @@ class AgentBridge:
 
     def diagnostics(self, path: str = "") -> dict:
         """Get errors and warnings for a file (or all open files if path is empty)."""
-        qs = f"?path={path}" if path else ""
+        qs = f"?path={quote(path, safe='')}" if path else ""
         return self._get(f"/diagnostics{qs}")
 
     def exec_command(self, command: str, *args) -> Any:
@@ -216,7 +615,7 @@ class AgentBridge:
 
     def keep_going(self) -> list[str]:
         """Click all Allow/Continue/Keep/Accept dialogs once. Returns commands run."""
-        return self._post("/keep-going", {}).get("commands_run", [])
+        return self._post_raw("/keep-going", _EMPTY).get("commands_run", [])
 
     def auto_dismiss(self, active: bool = True, interval_ms: int = 1500) -> bool:
         """
@@ -226,9 +625,42 @@ class AgentBridge:
         return self._post("/auto-dismiss", {"active": active, "interval_ms": interval_ms}).get("active", active)
 
     def auto_dismiss_status(self) -> bool:
-        """Returns True if the auto-dismiss loop is currently running."""
+        """
+        Returns True if the auto-dismiss loop is currently running.
+
+        Deprecated for liveness monitoring: subscribe_dialogs() pushes each
+        dismissal as it happens instead of being polled.
+        """
         return self._get("/auto-dismiss").get("active", False)
 
+    def subscribe_dialogs(self, on_event) -> threading.Thread:
+        """
+        Stream dialog-dismiss events as they happen (Server-Sent Events).
+
+        Opens GET /dialogs/stream on a dedicated connection and calls
+        on_event(dict) from a daemon thread for every pushed event
+        ({ts, commands_run, source}) — no polling, no detection latency.
+        Returns the reader thread; the stream closes with the process.
+        """
+        if self.port is None:
+            self.port = self._cached_or_discover()
+        c = _BridgeConnection(self.host, self.port, timeout=None)
+        c.request("GET", "/dialogs/stream",
+                  headers={"Accept": "text/event-stream", "Connection": "keep-alive"})
+        resp = c.getresponse()
+
+        def reader():
+            while line := resp.readline():
+                if line.startswith(b"data:"):
+                    try:
+                        on_event(_loads(line[5:].strip()))
+                    except Exception:
+                        pass
+
+        t = threading.Thread(target=reader, daemon=True)
+        t.start()
+        return t
+
     # ── Change tracking ───────────────────────────────────────────────────
 
     def watch_start(self, label: str = "") -> str:
@@ -237,21 +669,35 @@ class AgentBridge:
 
     def watch_result(self, watch_id: str) -> list[str]:
         """Get files changed since a watch_start call."""
-        return self._get(f"/watch-result?id={watch_id}").get("files", [])
+        return self._get(_PATH_WATCH + watch_id).get("files_changed", [])
+
+    def watch_wait(self, watch_id: str, wait_ms: int = 30000) -> list[str]:
+        """
+        Long-poll for files changed since a watch_start call.
+
+        The server hangs the request until a change lands or wait_ms elapses,
+        so changes are seen near-instantly without a POLL_INTERVAL sleep loop.
+        Returns the changed files, or [] if nothing changed before the timeout.
+        """
+        status, data = self._request("GET", _PATH_WATCH + watch_id + "&wait_ms=" + str(wait_ms),
+                                     timeout=wait_ms / 1000 + 5)
+        if not data.get("ok") and status >= 400:
+            raise BridgeError(f"GET /watch-result failed: {data.get('error', data)}")
+        return data.get("files_changed", [])
 
     def changes_since(self, timestamp_ms: int) -> list[str]:
         """Get files changed since a Unix timestamp in milliseconds."""
-        return self._get(f"/changes-since?ts={timestamp_ms}").get("files", [])
+        return self._get(_PATH_CHANGES + str(timestamp_ms)).get("files", [])
 
     def pending_approvals(self) -> list[str]:
         """Returns list of unsaved/dirty documents awaiting approval."""
         return self._get("/pending-approvals").get("files", [])
 
     def accept_edits(self) -> bool:
-        return self._post("/accept-edits", {}).get("ok", False)
+        return self._post_raw("/accept-edits", _EMPTY).get("ok", False)
 
     def reject_edits(self) -> bool:
-        return self._post("/reject-edits", {}).get("ok", False)
+        return self._post_raw("/reject-edits", _EMPTY).get("ok", False)
 
     # ── Integrations ──────────────────────────────────────────────────────
 
@@ -274,6 +720,26 @@ class AgentBridge:
         if window_title: body["window_title"] = window_title
         return self._post("/desktop-type", body).get("ok", False)
 
+    # ── Batch ─────────────────────────────────────────────────────────────
+
+    def batch(self, calls: list[tuple[str, dict | None]]) -> list[dict]:
+        """
+        Execute several bridge calls in one HTTP round-trip.
+
+        Each call is (path, body): a dict body issues a POST, None issues a
+        GET (query string goes in the path). The server runs the calls
+        sequentially and returns one result dict per call, saving n-1
+        round-trips versus issuing them individually.
+
+        Example:
+            ok, pending = bridge.batch([("/keep-going", {}), ("/pending-approvals", None)])
+        """
+        payload = {"calls": [
+            {"path": p} if body is None else {"path": p, "body": body}
+            for p, body in calls
+        ]}
+        return self._post("/batch", payload).get("results", [])
+
     # ── High-level helpers ────────────────────────────────────────────────
 
     def ask_then_run(self, task_description: str, run_result: bool = True, slack_report: bool = False) -> dict:
@@ -308,6 +774,87 @@ class AgentBridge:
         return result
 
 
+# ── Multi-bridge multiplexing ─────────────────────────────────────────────────
+
+def wait_any(bridges: list["AgentBridge"], timeout: float | None = None) -> list["AgentBridge"]:
+    """
+    Block until data is waiting on any bridge's persistent socket.
+
+    Lets one thread fan out over several VS Code instances without a sleep
+    loop per bridge: fire a hanging request per bridge (e.g. watch_wait from
+    worker threads), then block here on the sockets directly — the kernel
+    wakes us the instant any bridge responds, with zero CPU burned between.
+    Bridges that have no open socket yet are skipped. Returns the bridges
+    with readable data, or [] on timeout.
+    """
+    sel = selectors.DefaultSelector()
+    try:
+        registered = 0
+        for b in bridges:
+            c = b._conn_cache
+            if c is not None and c.sock is not None:
+                sel.register(c.sock, selectors.EVENT_READ, b)
+                registered += 1
+        if not registered:
+            return []
+        return [key.data for key, _ in sel.select(timeout)]
+    finally:
+        sel.close()
+
+
+# ── Diff post-processing ──────────────────────────────────────────────────────
+
+def _preview_stats_py(data: bytes) -> tuple[int, int]:
+    lines, longest, cur = 0, 0, 0
+    for byte in data:
+        if byte == 10:
+            lines += 1
+            longest = max(longest, cur)
+            cur = 0
+        else:
+            cur += 1
+    return lines + (1 if cur else 0), max(longest, cur)
+
+
+def _build_preview_stats():
+    # numba is imported lazily — only agents that post-process diffs pay its
+    # import cost, and cache=True amortizes the one-off JIT compile across
+    # invocations. Without numba the plain-Python loop is used as-is.
+    try:
+        import numba
+        import numpy
+    except ImportError:
+        return _preview_stats_py
+    kernel = numba.njit(cache=True, nogil=True)(_preview_stats_py)
+    return lambda data: tuple(int(v) for v in kernel(numpy.frombuffer(data, dtype=numpy.uint8)))
+
+
+_preview_stats = None
+
+
+def diff_stats(task_result: dict) -> dict:
+    """
+    Aggregate line/size stats over a copilot_task result's diff_summary.
+
+    Returns {'files', 'lines', 'longest_line', 'bytes'} computed from the
+    per-file previews, so reports can be built without re-reading the
+    changed files. Single-pass per preview; numba-accelerated when numba
+    is installed.
+    """
+    global _preview_stats
+    if _preview_stats is None:
+        _preview_stats = _build_preview_stats()
+    files = lines = longest = size = 0
+    for entry in task_result.get("diff_summary", []):
+        data = entry.get("preview", "").encode()
+        files += 1
+        size += len(data)
+        n, ll = _preview_stats(data)
+        lines += n
+        longest = max(longest, ll)
+    return {"files": files, "lines": lines, "longest_line": longest, "bytes": size}
+
+
 # ── Exception ─────────────────────────────────────────────────────────────────
 
 class BridgeError(Exception):
@@ -327,12 +874,14 @@ if __name__ == "__main__":
         print(f"Models available: {len(h.get('models', []))}")
         print(f"Workspace: {h.get('workspace', 'N/A')}")
 
-        if "--prompt" in sys.argv:
-            idx = sys.argv.index("--prompt")
-            q = " ".join(sys.argv[idx + 1:]) if idx + 1 < len(sys.argv) else "Say hello in one sentence."
-            print(f"\nPrompting Copilot: {q!r}")
-            answer = bridge.prompt(q)
-            print(f"Response: {answer}")
+        it = iter(sys.argv[1:])
+        for tok in it:
+            if tok == "--prompt":   # single pass: join(it) consumes the rest
+                q = " ".join(it) or "Say hello in one sentence."
+                print(f"\nPrompting Copilot: {q!r}")
+                answer = bridge.prompt(q)
+                print(f"Response: {answer}")
+                break
 
     except BridgeError as e:
         print(f"ERROR: {e}")
@@ -1,6 +1,7 @@
 import * as http from 'http';
 import * as fs   from 'fs';
 import * as np   from 'path';
+import * as zlib from 'zlib';
 import * as vscode from 'vscode';
 import { exec } from 'child_process';
 import { ShellResult } from './types';
@@ -9,15 +10,24 @@ import { logEntries, LOG_DIR } from './state';
 let logPanel: vscode.WebviewPanel | null = null;
 export const setLogPanel = (p: vscode.WebviewPanel | null) => { logPanel = p; };
 
-/** Send a JSON response. */
+/** Send a JSON response, gzipped when the client accepts it and it's worth it. */
 export const send = (res: http.ServerResponse, status: number, data: unknown) => {
-  const j = JSON.stringify(data);
-  res.writeHead(status, {
+  let j: string | Buffer = JSON.stringify(data);
+  const headers: http.OutgoingHttpHeaders = {
     'Content-Type': 'application/json;charset=utf-8',
     'Access-Control-Allow-Origin': '*',
     'Access-Control-Allow-Headers': '*',
     'Access-Control-Allow-Methods': '*',
-  });
+  };
+  const accepts = String(res.req?.headers['accept-encoding'] ?? '');
+  if (j.length > 1024 && /\bgzip\b/.test(accepts)) {
+    j = zlib.gzipSync(j);   // /log, /read-file, /diagnostics shrink 5-10x
+    headers['Content-Encoding'] = 'gzip';
+  }
+  // Explicit length instead of Node's default chunked encoding — simpler
+  // responses for every client, and required by the Python fast path.
+  headers['Content-Length'] = Buffer.byteLength(j);
+  res.writeHead(status, headers);
   res.end(j);
 };
 
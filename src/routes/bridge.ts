@@ -1,3 +1,4 @@
+import * as http from 'http';
 import * as vscode from 'vscode';
 import * as fs from 'fs';
 import * as np from 'path';
@@ -12,10 +13,25 @@ import { ACCEPT, REJECT, KEEP_GOING_CMDS, tryCmds } from '../copilot';
 
 const uniq = (l: typeof chlog) => [...new Set(l.map(c => c.path))];
 
+// SSE subscribers for /dialogs/stream — dialog-dismiss events are pushed the
+// moment they happen, so clients need no status polling at all.
+const dialogSubscribers = new Set<http.ServerResponse>();
+
+function broadcastDialogEvent(event: Record<string, unknown>) {
+  if (!dialogSubscribers.size) return;
+  const frame = `data: ${JSON.stringify(event)}\n\n`;
+  for (const sub of dialogSubscribers) {
+    try { sub.write(frame); } catch { dialogSubscribers.delete(sub); }
+  }
+}
+
 function startAutoDismiss(intervalMs = 1500) {
   if (autoDismissTimer) return;
   setAutoDismissTimer(setInterval(async () => {
-    try { await tryCmds(KEEP_GOING_CMDS); } catch {}
+    try {
+      const ran = await tryCmds(KEEP_GOING_CMDS);
+      if (ran.length) broadcastDialogEvent({ ts: Date.now(), commands_run: ran, source: 'auto-dismiss' });
+    } catch {}
     try { await vscode.commands.executeCommand('workbench.action.acceptSelectedQuickOpenItem'); } catch {}
   }, intervalMs));
 }
@@ -53,6 +69,20 @@ export const bridgeRoutes: RouteModule = async ({ meth, pathStr, qp, b, res }) =
     return true;
   }
 
+  // GET /dialogs/stream  — SSE: pushes { ts, commands_run, source } per dismissal
+  if (meth === 'GET' && pathStr === '/dialogs/stream') {
+    res.writeHead(200, {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache',
+      'Connection': 'keep-alive',
+      'Access-Control-Allow-Origin': '*',
+    });
+    res.write(': connected\n\n');
+    dialogSubscribers.add(res);
+    res.on('close', () => dialogSubscribers.delete(res));
+    return true;
+  }
+
   // GET /auto-dismiss
   if (meth === 'GET' && pathStr === '/auto-dismiss') {
     send(res, 200, { ok: true, active: autoDismissTimer !== null });
@@ -76,11 +106,19 @@ export const bridgeRoutes: RouteModule = async ({ meth, pathStr, qp, b, res }) =
     return true;
   }
 
-  // GET /watch-result?id=<id>
+  // GET /watch-result?id=<id>[&wait_ms=<n>]
   if (meth === 'GET' && pathStr === '/watch-result') {
     const sess = sessions.get(qp.id ?? '');
     if (!sess) { send(res, 404, { ok: false, error: 'watch_id not found' }); return true; }
-    const files = uniq(chlog.filter(c => c.ts > sess.startTs));
+    const collect = () => uniq(chlog.filter(c => c.ts > sess.startTs));
+    let files = collect();
+    // Long-poll: with wait_ms set, hang the request until a change lands or
+    // the deadline passes, so clients see changes without a 2-s polling loop.
+    const deadline = Date.now() + Math.min(Number(qp.wait_ms ?? 0), 120_000);
+    while (!files.length && Date.now() < deadline) {
+      await new Promise(r => setTimeout(r, 250));
+      files = collect();
+    }
     send(res, 200, { ok: true, watch_id: qp.id, files_changed: files });
     return true;
   }
@@ -103,6 +141,7 @@ export const bridgeRoutes: RouteModule = async ({ meth, pathStr, qp, b, res }) =
   // POST /keep-going
   if (meth === 'POST' && pathStr === '/keep-going') {
     const ran = await tryCmds(KEEP_GOING_CMDS);
+    if (ran.length) broadcastDialogEvent({ ts: Date.now(), commands_run: ran, source: 'keep-going' });
     await vscode.workspace.saveAll(false);
     try { await vscode.commands.executeCommand('workbench.action.acceptSelectedQuickOpenItem'); } catch {}
     send(res, 200, { ok: true, commands_run: ran, note: 'Dismissed dialogs + saved all' });
@@ -6,15 +6,28 @@ import { callCopilot, buildPromptWithContext, ACCEPT, tryCmds } from '../copilot
 
 const uniq = (l: typeof chlog) => [...new Set(l.map(c => c.path))];
 
-export const copilotRoutes: RouteModule = async ({ meth, pathStr, b, res }) => {
+/** Resolve context_files + context_globs into one path list (globs expand server-side). */
+async function resolveContextPaths(b: Record<string, unknown>): Promise<string[]> {
+  let paths = Array.isArray(b.context_files) ? (b.context_files as string[]) : [];
+  const globs = Array.isArray(b.context_globs) ? (b.context_globs as string[]) : [];
+  for (const g of globs.slice(0, 8)) {
+    try {
+      const found = await vscode.workspace.findFiles(g, '**/node_modules/**', 50);
+      paths = paths.concat(found.map(u => u.fsPath));
+    } catch {}
+  }
+  return paths;
+}
 
-  // POST /prompt  { prompt, model?, system?, timeout?, context_files? }
+export const copilotRoutes: RouteModule = async ({ meth, pathStr, qp, b, res }) => {
+
+  // POST /prompt  { prompt, model?, system?, timeout?, context_files?, context_globs? }
   if (meth === 'POST' && pathStr === '/prompt') {
     const p = String(b.prompt ?? '').trim();
     if (!p) { send(res, 400, { ok: false, error: 'prompt required' }); return true; }
     const t0 = Date.now();
     try {
-      const ctxPaths = Array.isArray(b.context_files) ? (b.context_files as string[]) : [];
+      const ctxPaths = await resolveContextPaths(b);
       const fullPrompt = await buildPromptWithContext(p, ctxPaths, b.active_file_context === true || b.active_file_context === 'true');
       const r = await callCopilot(fullPrompt, b.system as string | undefined, b.model as string | undefined, Number(b.timeout ?? 300) * 1000);
       const out = { ok: true, ...r, elapsed_ms: Date.now() - t0, context_files_injected: ctxPaths.length };
@@ -24,62 +37,107 @@ export const copilotRoutes: RouteModule = async ({ meth, pathStr, b, res }) => {
     return true;
   }
 
-  // POST /copilot-task  { prompt, auto_accept?, watch_secs?, timeout?, context_files? }
+  // POST /copilot-task  { prompt, auto_accept?, watch_secs?, timeout?, context_files?, context_globs? }
   if (meth === 'POST' && pathStr === '/copilot-task') {
     const p = String(b.prompt ?? '').trim();
     if (!p) { send(res, 400, { ok: false, error: 'prompt required' }); return true; }
-    const autoAccept = b.auto_accept !== false;
-    const watchMs    = Math.min(Number(b.watch_secs ?? 60), 300) * 1000;
-    const timeoutMs  = Number(b.timeout ?? 300) * 1000;
-    const t0         = Date.now();
-    const watchId    = `w_${t0}`;
-    sessions.set(watchId, { startTs: t0, label: p.slice(0, 80) });
-
-    const ctxPaths    = Array.isArray(b.context_files) ? (b.context_files as string[]) : [];
-    const fullPrompt  = await buildPromptWithContext(p, ctxPaths, !!b.active_file_context);
-
-    let llm_response = '', model_used = '';
-
-    // Start auto-dismiss loop so Allow/Continue/Keep buttons get clicked in real-time
-    let autoDismissInterval: NodeJS.Timeout | null = null;
-    if (autoAccept) {
-      autoDismissInterval = setInterval(async () => {
-        try { await vscode.commands.executeCommand('workbench.action.chat.acceptAllCopilotEdits'); } catch {}
-        try { await vscode.commands.executeCommand('workbench.action.acceptSelectedQuickOpenItem'); } catch {}
-      }, 1200);
-    }
+    try { send(res, 200, await runCopilotTask(b)); }
+    catch (e) { send(res, 500, { ok: false, error: `Copilot call failed: ${e}` }); }
+    return true;
+  }
 
-    try {
-      const r = await callCopilot(fullPrompt, b.system as string | undefined, b.model as string | undefined, timeoutMs);
-      llm_response = r.text; model_used = r.model_used;
-    } catch (e) {
-      if (autoDismissInterval) clearInterval(autoDismissInterval);
-      send(res, 500, { ok: false, error: `Copilot call failed: ${e}` }); return true;
-    }
-
-    await new Promise(r => setTimeout(r, watchMs));
-    if (autoDismissInterval) clearInterval(autoDismissInterval);
+  // POST /copilot-task/submit  — same body; returns a job_id immediately
+  if (meth === 'POST' && pathStr === '/copilot-task/submit') {
+    const p = String(b.prompt ?? '').trim();
+    if (!p) { send(res, 400, { ok: false, error: 'prompt required' }); return true; }
+    sweepJobs();
+    const id = `job_${Date.now()}_${++jobSeq}`;   // counter: same-ms submits must not collide
+    jobs.set(id, { done: false });
+    runCopilotTask(b)
+      .then(r  => jobs.set(id, { done: true, result: r, doneTs: Date.now() }))
+      .catch(e => jobs.set(id, { done: true, error: `Copilot call failed: ${e}`, doneTs: Date.now() }));
+    send(res, 200, { ok: true, job_id: id });
+    return true;
+  }
 
-    const changedFiles = uniq(chlog.filter(c => c.ts > t0));
-    let accepted = false;
-    if (autoAccept) {
-      await tryCmds(ACCEPT);
-      await vscode.workspace.saveAll(false);
-      accepted = true;
-    }
-    const diff_summary = await Promise.all(changedFiles.slice(0, 10).map(async f => {
-      try { const t = await readText(f); return { path: f, lines: t.split('\n').length, preview: t.slice(0, 6000) }; }
-      catch { return { path: f, lines: -1, preview: '' }; }
-    }));
-    const out = {
-      ok: true, watch_id: watchId, llm_response, model_used,
-      files_changed: changedFiles, diff_summary, accepted,
-      context_files_injected: ctxPaths.length, elapsed_ms: Date.now() - t0,
-    };
-    log('POST', '/copilot-task', { prompt: p.slice(0, 100) }, { files: changedFiles.length, model: model_used });
-    send(res, 200, out);
+  // GET /copilot-task/status?id=<job_id>
+  if (meth === 'GET' && pathStr === '/copilot-task/status') {
+    const job = jobs.get(qp.id ?? '');
+    if (!job) { send(res, 404, { ok: false, error: 'job_id not found' }); return true; }
+    if (!job.done) { send(res, 200, { ok: true, done: false }); return true; }
+    jobs.delete(qp.id ?? '');
+    if (job.error) send(res, 200, { ok: false, done: true, error: job.error });
+    else           send(res, 200, { done: true, ...(job.result as Record<string, unknown>) });
     return true;
   }
 
   return false;
 };
+
+const jobs = new Map<string, { done: boolean; result?: Record<string, unknown>; error?: string; doneTs?: number }>();
+let jobSeq = 0;
+
+const JOB_TTL_MS = 10 * 60_000;
+
+/** Evict finished jobs nobody polled (dead clients would otherwise leak their diff previews for the host's lifetime). */
+function sweepJobs() {
+  const cutoff = Date.now() - JOB_TTL_MS;
+  for (const [id, job] of jobs) {
+    if (job.done && (job.doneTs ?? 0) < cutoff) jobs.delete(id);
+  }
+}
+
+/** The full /copilot-task pipeline — shared by the blocking and submit/status routes. */
+async function runCopilotTask(b: Record<string, unknown>): Promise<Record<string, unknown>> {
+  const p          = String(b.prompt ?? '').trim();
+  const autoAccept = b.auto_accept !== false;
+  const watchMs    = Math.min(Number(b.watch_secs ?? 60), 300) * 1000;
+  const timeoutMs  = Number(b.timeout ?? 300) * 1000;
+  const t0         = Date.now();
+  const watchId    = `w_${t0}`;
+  sessions.set(watchId, { startTs: t0, label: p.slice(0, 80) });
+
+  const ctxPaths    = await resolveContextPaths(b);
+  const fullPrompt  = await buildPromptWithContext(p, ctxPaths, !!b.active_file_context);
+
+  let llm_response = '', model_used = '';
+
+  // Start auto-dismiss loop so Allow/Continue/Keep buttons get clicked in real-time
+  let autoDismissInterval: NodeJS.Timeout | null = null;
+  if (autoAccept) {
+    autoDismissInterval = setInterval(async () => {
+      try { await vscode.commands.executeCommand('workbench.action.chat.acceptAllCopilotEdits'); } catch {}
+      try { await vscode.commands.executeCommand('workbench.action.acceptSelectedQuickOpenItem'); } catch {}
+    }, 1200);
+  }
+
+  try {
+    const r = await callCopilot(fullPrompt, b.system as string | undefined, b.model as string | undefined, timeoutMs);
+    llm_response = r.text; model_used = r.model_used;
+  } catch (e) {
+    if (autoDismissInterval) clearInterval(autoDismissInterval);
+    throw e;
+  }
+
+  await new Promise(r => setTimeout(r, watchMs));
+  if (autoDismissInterval) clearInterval(autoDismissInterval);
+
+  const changedFiles = uniq(chlog.filter(c => c.ts > t0));
+  let accepted = false;
+  if (autoAccept) {
+    await tryCmds(ACCEPT);
+    await vscode.workspace.saveAll(false);
+    accepted = true;
+  }
+  const diff_summary = await Promise.all(changedFiles.slice(0, 10).map(async f => {
+    try { const t = await readText(f); return { path: f, lines: t.split('\n').length, preview: t.slice(0, 6000) }; }
+    catch { return { path: f, lines: -1, preview: '' }; }
+  }));
+  const out = {
+    ok: true, watch_id: watchId, llm_response, model_used,
+    files_changed: changedFiles, diff_summary, accepted,
+    context_files_injected: ctxPaths.length, elapsed_ms: Date.now() - t0,
+  };
+  log('POST', '/copilot-task', { prompt: p.slice(0, 100) }, { files: changedFiles.length, model: model_used });
+  return out;
+}
@@ -34,6 +34,17 @@ export const filesystemRoutes: RouteModule = async ({ meth, pathStr, qp, b, res
     return true;
   }
 
+  // POST /read-file  { path }  — body variant for paths too long for a URL
+  if (meth === 'POST' && pathStr === '/read-file') {
+    const fp = String(b.path ?? '').trim();
+    if (!fp) { send(res, 400, { ok: false, error: 'path required' }); return true; }
+    try {
+      const content = await readText(fp);
+      send(res, 200, { ok: true, path: fp, content, lines: content.split('\n').length });
+    } catch (e) { send(res, 500, { ok: false, error: String(e) }); }
+    return true;
+  }
+
   // POST /write-file  { path, content, create_dirs? }
   if (meth === 'POST' && pathStr === '/write-file') {
     const fp      = String(b.path ?? '').trim();
@@ -137,6 +137,44 @@ async function route(req: http.IncomingMessage, res: http.ServerResponse) {
   }
 
   const b = await body(req);
+
+  // POST /batch  { calls: [{ path, body? }, ...] }
+  // Runs the calls sequentially server-side and returns one result per call,
+  // saving the client n-1 round-trips. body present → POST, absent → GET.
+  if (meth === 'POST' && pathStr === '/batch') {
+    const calls = Array.isArray(b.calls)
+      ? (b.calls as { path?: string; body?: Record<string, unknown> }[]).slice(0, 20)
+      : [];
+    if (!calls.length) { send(res, 400, { ok: false, error: 'calls required' }); return; }
+    const results: unknown[] = [];
+    for (const call of calls) {
+      const subUrl  = String(call.path ?? '');
+      const subPath = subUrl.split('?')[0];
+      if (subPath === '/batch') { results.push({ ok: false, error: 'nested batch not allowed' }); continue; }
+      // Streaming routes write to the raw response and never end() — they
+      // can't run behind the capturing shim.
+      if (subPath === '/dialogs/stream') { results.push({ ok: false, error: 'streaming endpoints not allowed in batch' }); continue; }
+      let captured: unknown = { ok: false, error: `Unknown: ${subPath}` };
+      const fake = {
+        writeHead: () => fake,
+        end: (j?: string) => { try { captured = JSON.parse(j || '{}'); } catch { captured = { ok: false, error: 'unparseable sub-response' }; } },
+      } as unknown as http.ServerResponse;
+      const subCtx = {
+        meth:    call.body !== undefined ? 'POST' : 'GET',
+        pathStr: subPath,
+        qp:      qs(subUrl),
+        b:       (call.body ?? {}) as Record<string, unknown>,
+        req, res: fake,
+      };
+      try {
+        for (const mod of ROUTE_MODULES) { if (await mod(subCtx)) break; }
+      } catch (e) { captured = { ok: false, error: String(e) }; }
+      results.push(captured);
+    }
+    send(res, 200, { ok: true, results });
+    return;
+  }
+
   const ctx = { meth, pathStr, qp, b, req, res };
 
   for (const mod of ROUTE_MODULES) {